@@ -1,101 +1,220 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import time
+import urllib.request
+from functools import lru_cache
+from html import escape
 from typing import List
+from urllib.parse import quote
 
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
 USER_AGENT = "Mozilla/5.0 (FintechScraper/1.0)"
 TIMEOUT = 10  # seconds
 DATA_DIR = os.path.join(os.path.dirname(__file__), "scraped_data")
 TRACK_FILE = "downloaded.json"
+VIEW_FILE = "view.json"
+QUOTE_TTL = 60  # seconds
+STATIC_MAX_AGE = 3600  # seconds browsers may reuse a downloaded file
+
+# static chrome shared by every rendered page
+_INDEX_HEAD = "<html><body><h1>Fintech Companies</h1><ul>"
+_PAGE_TAIL = "</ul></body></html>"
+
+# ticker -> (expiry on the monotonic clock, quote)
+_QUOTE_CACHE: dict[str, tuple[float, dict]] = {}
+
+# Reuse connections to Yahoo across page views when requests is installed
+SESSION = requests.Session() if requests is not None else None
+if SESSION is not None:
+    SESSION.headers["User-Agent"] = USER_AGENT
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep investor files for a while."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        # Starlette already sets a stat-based ETag and answers If-None-Match
+        # with 304, so only Cache-Control is missing
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        response.headers["Cache-Control"] = f"public, max-age={STATIC_MAX_AGE}"
+        return response
+
+
+class PageGZipMiddleware(GZipMiddleware):
+    """GZip the rendered pages but not /data, whose files are already compressed."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith("/data/"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 
 app = FastAPI(title="Fintech Investor Materials")
-app.mount("/data", StaticFiles(directory=DATA_DIR), name="data")
+app.add_middleware(PageGZipMiddleware, minimum_size=1024)
+app.mount("/data", CachedStaticFiles(directory=DATA_DIR), name="data")
+
+
+@lru_cache(maxsize=1)
+def _list_companies_cached(mtime_ns: int) -> tuple[str, ...]:
+    # DirEntry.is_dir comes from the directory read itself, no stat per entry
+    with os.scandir(DATA_DIR) as it:
+        return tuple(sorted(e.name for e in it if e.is_dir(follow_symlinks=False)))
 
 
 def list_companies() -> List[str]:
-    if not os.path.exists(DATA_DIR):
+    # adding a company directory bumps the mtime of DATA_DIR
+    try:
+        mtime_ns = os.stat(DATA_DIR).st_mtime_ns
+    except FileNotFoundError:
         return []
-    return sorted(d for d in os.listdir(DATA_DIR) if os.path.isdir(os.path.join(DATA_DIR, d)))
+    return list(_list_companies_cached(mtime_ns))
+
+
+@lru_cache(maxsize=256)
+def _read_json_cached(path: str, mtime_ns: int, size: int):
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def read_json(path: str):
+    """Parse a JSON file, reusing the result until the file is rewritten.
+
+    The returned object is shared between requests and must not be mutated.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _read_json_cached(path, st.st_mtime_ns, st.st_size)
 
 
 def load_history(company: str) -> dict:
-    path = os.path.join(DATA_DIR, company, TRACK_FILE)
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    history = read_json(os.path.join(DATA_DIR, company, TRACK_FILE))
+    return history if history is not None else {}
+
+
+def known_tickers() -> List[str]:
+    tickers = []
+    for company in list_companies():
+        meta = read_json(os.path.join(DATA_DIR, company, "metadata.json"))
+        if meta and meta.get("ticker"):
+            tickers.append(meta["ticker"])
+    return tickers
+
+
+def prime_quotes(tickers: List[str]) -> None:
+    """Fetch quotes for several tickers with one Yahoo request and cache them."""
+    if not tickers:
+        return
+    symbols = ",".join(tickers)
+    url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={symbols}"
+    try:
+        if SESSION is not None:
+            resp = SESSION.get(url, timeout=TIMEOUT)
+            resp.raise_for_status()
+            data = _loads(resp.content)
+        else:
+            req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+                data = _loads(resp.read())
+    except Exception as e:
+        print(f"Failed market data for {symbols}: {e}")
+        return
+    expires = time.monotonic() + QUOTE_TTL
+    for q in data.get("quoteResponse", {}).get("result", []):
+        _QUOTE_CACHE[q.get("symbol")] = (expires, {
+            "price": q.get("regularMarketPrice"),
+            "marketCap": q.get("marketCap"),
+            "currency": q.get("currency"),
+        })
 
 
 def fetch_market_data(ticker: str) -> dict | None:
     if not ticker:
         return None
-    url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={ticker}"
-    try:
-        import urllib.request
-        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        quote = data.get("quoteResponse", {}).get("result", [])
-        if quote:
-            q = quote[0]
-            return {
-                "price": q.get("regularMarketPrice"),
-                "marketCap": q.get("marketCap"),
-                "currency": q.get("currency"),
-            }
-    except Exception as e:
-        print(f"Failed market data for {ticker}: {e}")
+    cached = _QUOTE_CACHE.get(ticker)
+    if cached is None or cached[0] <= time.monotonic():
+        # refresh every company at once so the next page views hit the cache
+        tickers = known_tickers()
+        if ticker not in tickers:
+            tickers.append(ticker)
+        prime_quotes(tickers)
+        cached = _QUOTE_CACHE.get(ticker)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
     return None
 
 
+def _title(slug: str) -> str:
+    return escape(slug.replace("_", " ").title())
+
+
+@lru_cache(maxsize=1)
+def render_index(companies: tuple[str, ...]) -> str:
+    items = (f'<li><a href="/{quote(c)}">{_title(c)}</a></li>' for c in companies)
+    return "".join([_INDEX_HEAD, *items, _PAGE_TAIL])
+
+
 @app.get("/", response_class=HTMLResponse)
-def index():
-    companies = list_companies()
-    items = "".join(
-        f'<li><a href="/{c}">{c.replace("_", " ").title()}</a></li>' for c in companies
-    )
-    html = f"""
-    <html>
-    <body>
-    <h1>Fintech Companies</h1>
-    <ul>{items}</ul>
-    </body>
-    </html>
-    """
-    return HTMLResponse(html)
+async def index():
+    companies = await asyncio.to_thread(list_companies)
+    return HTMLResponse(render_index(tuple(companies)))
 
 
-@app.get("/{company}", response_class=HTMLResponse)
-def company_page(company: str):
+def load_view(company: str) -> dict | None:
+    """Return the ticker and file list the scraper precomputed for a company."""
+    company_dir = os.path.join(DATA_DIR, company)
+    view = read_json(os.path.join(company_dir, VIEW_FILE))
+    if view is not None:
+        return view
+    if not os.path.isdir(company_dir):
+        return None
+    # scraped before view.json existed: derive it from history and metadata;
+    # older scrapes stored bare filenames and several URLs may share a file
+    meta = read_json(os.path.join(company_dir, "metadata.json")) or {}
     history = load_history(company)
-    if history is None:
+    files = sorted({e["file"] if isinstance(e, dict) else e for e in history.values()})
+    return {"ticker": meta.get("ticker"), "files": files}
+
+
+@lru_cache(maxsize=64)
+def render_files(company: str, files: tuple[str, ...]) -> str:
+    base = f"/data/{quote(company)}/"
+    return "".join(f'<li><a href="{base}{quote(f)}">{escape(f)}</a></li>' for f in files)
+
+
+@app.get("/{company}", response_class=HTMLResponse)
+async def company_page(company: str):
+    view = await asyncio.to_thread(load_view, company)
+    if view is None:
         raise HTTPException(status_code=404, detail="Company not found")
-    files = [history[url] for url in history]
-    files.sort()
-    ticker = None
-    meta_path = os.path.join(DATA_DIR, company, "metadata.json")
-    if os.path.exists(meta_path):
-        with open(meta_path, "r", encoding="utf-8") as f:
-            meta = json.load(f)
-            ticker = meta.get("ticker")
-    stats = fetch_market_data(ticker) if ticker else None
-    rows = "".join(f"<li><a href='/data/{company}/{f}'>{f}</a></li>" for f in files)
-    stats_html = ""
+    ticker = view.get("ticker")
+    stats = await asyncio.to_thread(fetch_market_data, ticker) if ticker else None
+    parts = ["<html><body><h1>", _title(company), "</h1>"]
     if stats:
-        stats_html = (
-            f"<p>Price: {stats['price']} {stats['currency']}<br>"
-            f"Market Cap: {stats['marketCap']}</p>"
+        parts.append(
+            f"<p>Price: {escape(str(stats['price']))} {escape(str(stats['currency']))}<br>"
+            f"Market Cap: {escape(str(stats['marketCap']))}</p>"
         )
-    html = f"""
-    <html><body>
-    <h1>{company.replace('_',' ').title()}</h1>
-    {stats_html}
-    <ul>{rows}</ul>
-    </body></html>
-    """
-    return HTMLResponse(html)
+    parts += ["<ul>", render_files(company, tuple(view["files"])), _PAGE_TAIL]
+    return HTMLResponse("".join(parts))
@@ -5,37 +5,128 @@ Downloads investor materials for all listed companies
 and stores them under scraped_data/<company>.
 Tracks downloaded URLs to avoid duplicates.
 
-This script uses only the Python standard library.
+This script only requires the Python standard library. When installed,
+requests is used for pooled keep-alive connections, orjson for faster
+JSON handling, selectolax for faster HTML parsing and Playwright for
+pages that need JavaScript.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import json
+import re
+import shutil
+import socket
 import time
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from html.parser import HTMLParser
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
 import logging
 
 try:
-    from playwright.sync_api import sync_playwright
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None).encode("utf-8")
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+try:
+    from selectolax.parser import HTMLParser as FastHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except Exception:  # ImportError or other runtime issue
     PLAYWRIGHT_AVAILABLE = False
 
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s [%(levelname)s] %(message)s",
 )
 logger = logging.getLogger(__name__)
 USER_AGENT = "Mozilla/5.0 (FintechScraper/1.0)"
 HEADERS = {"User-Agent": USER_AGENT}
 TIMEOUT = 10  # seconds
+COMPANY_CONCURRENCY = 8  # companies scraped at once
+DOWNLOAD_WORKERS = 16  # downloads in flight across all companies
+LINK_QUEUE_SIZE = 1024  # parsed links waiting for a download worker
+DNS_TTL = 300  # seconds a resolved host is reused
+HTTP_WORKERS = 32  # threads doing blocking HTTP, one pooled connection each
+CHUNK_SIZE = 64 * 1024  # bytes buffered per download
+# resource types Playwright does not need to load to find links
+BLOCKED_RESOURCES = {"image", "font", "media", "stylesheet"}
+# investor file extensions, optionally followed by a query string or fragment
+DOWNLOAD_RE = re.compile(r"\.(?:pdf|zip|pptx?|xlsx?)(?:[?#]|$)", re.IGNORECASE)
+
+
+def make_session() -> "requests.Session":
+    """Build a keep-alive session shared by every request of a scrape."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=HTTP_WORKERS,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Falls back to one urllib connection per request when requests is missing
+SESSION = make_session() if REQUESTS_AVAILABLE else None
+
+# Neither urllib nor requests caches DNS, so every new connection to an IR
+# site or CDN would otherwise resolve its hostname again
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(*args, **kwargs):
+    key = (args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    cached = _DNS_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return list(cached[1])
+    result = _getaddrinfo(*args, **kwargs)
+    _DNS_CACHE[key] = (now + DNS_TTL, result)
+    return list(result)
+
+
+socket.getaddrinfo = _cached_getaddrinfo
+
+# Playwright state, bound to the event loop of the running scrape
+_PLAYWRIGHT = None
+_BROWSER = None
+_BROWSER_LOCK: asyncio.Lock | None = None
 
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "scraped_data")
 TRACK_FILE = "downloaded.json"
+JOURNAL_FILE = "downloaded.jsonl"  # appended per download, folded into TRACK_FILE
+VIEW_FILE = "view.json"  # name, ticker and file list rendered by app.py
+DIGEST_FILE = ".ir_digest"  # hash of the last fully processed IR page
 
 COMPANIES = [
     {
@@ -182,152 +273,455 @@ class LinkParser(HTMLParser):
             if attr == "href":
                 href = val
                 break
-        if href and any(href.lower().endswith(ext) for ext in [
-            ".pdf", ".zip", ".ppt", ".pptx", ".xls", ".xlsx"
-        ]):
+        if href and DOWNLOAD_RE.search(href):
             self.links.append(href)
 
 
+def extract_links(html: str) -> list[str]:
+    """Return hrefs on the page that point at likely investor files."""
+    if SELECTOLAX_AVAILABLE:
+        hrefs = (node.attributes.get("href") for node in FastHTMLParser(html).css("a[href]"))
+        return [href for href in hrefs if href and DOWNLOAD_RE.search(href)]
+    parser = LinkParser()
+    parser.feed(html)
+    return parser.links
+
+
+def canonical_url(url: str) -> str:
+    """Normalise a URL so trivially different links to one file compare equal.
+
+    Lowercases the scheme and host, drops the fragment and strips utm_*
+    tracking parameters.
+    """
+    parts = urlsplit(url)
+    query = parts.query
+    if "utm_" in query:
+        query = urlencode([
+            (k, v) for k, v in parse_qsl(query, keep_blank_values=True)
+            if not k.lower().startswith("utm_")
+        ])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ""))
+
+
+def url_filename(url: str) -> str:
+    """Return the last path segment of an absolute URL, or "" if it has none."""
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    if path.count("/") < 3:  # just scheme://host
+        return ""
+    return path.rsplit("/", 1)[1]
+
+
 def ensure_dir(path: str) -> None:
     if not os.path.exists(path):
-        logger.debug(f"Creating directory {path}")
+        logger.debug("Creating directory %s", path)
         os.makedirs(path)
 
 
 def load_history(company_dir: str) -> dict:
+    """Read the history snapshot and replay any journal written since.
+
+    Maps each downloaded URL to {"file", "etag", "lm", "size"}.
+    """
     track_path = os.path.join(company_dir, TRACK_FILE)
+    journal_path = os.path.join(company_dir, JOURNAL_FILE)
+    history = {}
     if os.path.exists(track_path):
-        logger.debug(f"Loading history from {track_path}")
-        with open(track_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+        logger.debug("Loading history from %s", track_path)
+        with open(track_path, "rb") as f:
+            history = _loads(f.read())
+    replayed = 0
+    if os.path.exists(journal_path):
+        logger.debug("Replaying history journal %s", journal_path)
+        with open(journal_path, "rb") as f:
+            for line in f:
+                try:
+                    record = _loads(line)
+                except ValueError:
+                    # torn final line from a crash mid-append
+                    continue
+                history[record.pop("url")] = record
+                replayed += 1
+    # older files map URLs straight to filenames and predate canonical URLs
+    migrated = {
+        canonical_url(url): {"file": entry} if isinstance(entry, str) else entry
+        for url, entry in history.items()
+    }
+    if replayed or list(migrated) != list(history) or any(
+        isinstance(entry, str) for entry in history.values()
+    ):
+        save_history(company_dir, migrated)
+    return migrated
+
+
+def append_history(company_dir: str, url: str, record: dict) -> None:
+    """Record one finished download in the append-only journal."""
+    journal_path = os.path.join(company_dir, JOURNAL_FILE)
+    with open(journal_path, "ab") as f:
+        f.write(_dumps({"url": url, **record}) + b"\n")
+
+
+def write_json_atomic(path: str, obj, pretty: bool = False) -> None:
+    """Write obj to path so readers only ever see the old or the new file."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_dumps(obj, pretty=pretty))
+    os.replace(tmp_path, path)
+
+
+def save_view(company_dir: str, meta: dict, history: dict) -> None:
+    """Precompute what the web UI shows for a company."""
+    files = sorted({record["file"] for record in history.values()})
+    write_json_atomic(os.path.join(company_dir, VIEW_FILE), {**meta, "files": files})
 
 
 def save_history(company_dir: str, history: dict) -> None:
+    """Atomically replace the snapshot, then drop the folded-in journal."""
     track_path = os.path.join(company_dir, TRACK_FILE)
-    logger.debug(f"Saving history to {track_path}")
-    with open(track_path, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
+    logger.debug("Saving history to %s", track_path)
+    write_json_atomic(track_path, history, pretty=True)
+    try:
+        os.remove(os.path.join(company_dir, JOURNAL_FILE))
+    except FileNotFoundError:
+        pass
 
 
-def download_file(url: str, dest: str) -> None:
-    logger.debug(f"Downloading {url} -> {dest}")
+def read_digest(company_dir: str) -> str | None:
+    try:
+        with open(os.path.join(company_dir, DIGEST_FILE), "r", encoding="utf-8") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        return None
+
+
+def write_digest(company_dir: str, digest: str) -> None:
+    with open(os.path.join(company_dir, DIGEST_FILE), "w", encoding="utf-8") as f:
+        f.write(digest)
+
+
+def fetch_page(url: str) -> str:
+    if SESSION is not None:
+        resp = SESSION.get(url, timeout=TIMEOUT)
+        resp.raise_for_status()
+        return resp.content.decode("utf-8", errors="ignore")
     req = urllib.request.Request(url, headers=HEADERS)
+    with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+        return resp.read().decode("utf-8", errors="ignore")
+
+
+def content_validators(headers) -> dict:
+    """Pick the response headers that identify a file's content."""
+    size = headers.get("Content-Length")
+    return {
+        "etag": headers.get("ETag"),
+        "lm": headers.get("Last-Modified"),
+        "size": int(size) if size and size.isdigit() else None,
+    }
+
+
+def content_keys(record: dict) -> list[tuple]:
+    """Keys under which two history records are considered the same file."""
+    keys = []
+    if record.get("etag"):
+        keys.append(("etag", record["etag"]))
+    if record.get("lm") and record.get("size") is not None:
+        keys.append(("lm", record["lm"], record["size"]))
+    return keys
+
+
+def probe_file(url: str) -> dict:
+    """Send a HEAD request and return the validators of the file behind url."""
+    if SESSION is not None:
+        resp = SESSION.head(url, timeout=TIMEOUT, allow_redirects=True)
+        resp.raise_for_status()
+        return content_validators(resp.headers)
+    req = urllib.request.Request(url, headers=HEADERS, method="HEAD")
+    with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
+        return content_validators(resp.headers)
+
+
+def download_file(url: str, dest: str) -> dict:
+    """Stream url to dest and return the validators of what was fetched."""
+    logger.debug("Downloading %s -> %s", url, dest)
     try:
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp, open(dest, "wb") as out:
-            data = resp.read()
-            logger.debug(f"Writing {len(data)} bytes")
-            out.write(data)
+        if SESSION is not None:
+            with SESSION.get(url, timeout=TIMEOUT, stream=True) as resp:
+                resp.raise_for_status()
+                validators = content_validators(resp.headers)
+                with open(dest, "wb") as out:
+                    for chunk in resp.iter_content(CHUNK_SIZE):
+                        out.write(chunk)
+                    size = out.tell()
+        else:
+            req = urllib.request.Request(url, headers=HEADERS)
+            with urllib.request.urlopen(req, timeout=TIMEOUT) as resp, open(dest, "wb") as out:
+                validators = content_validators(resp.headers)
+                shutil.copyfileobj(resp, out, CHUNK_SIZE)
+                size = out.tell()
+        logger.debug("Wrote %s bytes", size)
+        return validators
     except Exception as e:
-        logger.error(f"Failed download {url}: {e}")
+        logger.error("Failed download %s: %s", url, e)
         raise
 
 
-def fetch_links_playwright(url: str) -> list[str]:
+async def _ensure_browser():
+    """Start Chromium on first use and share it for the rest of the scrape."""
+    global _PLAYWRIGHT, _BROWSER, _BROWSER_LOCK
+    if _BROWSER_LOCK is None:
+        _BROWSER_LOCK = asyncio.Lock()
+    async with _BROWSER_LOCK:
+        if _BROWSER is None:
+            if _PLAYWRIGHT is None:
+                _PLAYWRIGHT = await async_playwright().start()
+            _BROWSER = await _PLAYWRIGHT.chromium.launch(headless=True)
+    return _BROWSER
+
+
+async def close_browser() -> None:
+    global _PLAYWRIGHT, _BROWSER, _BROWSER_LOCK
+    if _BROWSER is not None:
+        await _BROWSER.close()
+        _BROWSER = None
+    if _PLAYWRIGHT is not None:
+        await _PLAYWRIGHT.stop()
+        _PLAYWRIGHT = None
+    _BROWSER_LOCK = None
+
+
+async def _skip_heavy_resources(route) -> None:
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_links_playwright(url: str) -> list[str]:
     """Use Playwright to fetch links from pages that require JavaScript."""
     if not PLAYWRIGHT_AVAILABLE:
         raise RuntimeError("Playwright not installed")
-    logger.debug(f"Fetching links via Playwright from {url}")
+    logger.debug("Fetching links via Playwright from %s", url)
     links: list[str] = []
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.goto(url, timeout=60000)
-        page.wait_for_selector("a", timeout=60000)
-        handles = page.query_selector_all("a")
+    browser = await _ensure_browser()
+    context = await browser.new_context(user_agent=USER_AGENT)
+    try:
+        await context.route("**/*", _skip_heavy_resources)
+        page = await context.new_page()
+        await page.goto(url, timeout=60000, wait_until="domcontentloaded")
+        await page.wait_for_selector("a", timeout=60000)
+        handles = await page.query_selector_all("a")
         for handle in handles:
-            href = handle.get_attribute("href")
+            href = await handle.get_attribute("href")
             if href and ("pdf" in href.lower() or "quarterly" in href.lower()):
                 links.append(href)
-        browser.close()
-    logger.debug(f"Playwright found {len(links)} links")
+    finally:
+        await context.close()
+    logger.debug("Playwright found %s links", len(links))
     return links
 
 
 def push_to_chatgpt(path: str) -> None:
     """Placeholder for pushing files to custom ChatGPT."""
-    logger.info(f"[CHATGPT] Would push {path}")
+    logger.info("[CHATGPT] Would push %s", path)
 
 
-def scrape_company(company: dict) -> None:
+async def scrape_company(company: dict, queue: asyncio.Queue) -> None:
+    """Fetch and parse a company's IR page and queue its new links."""
     name = company["name"]
     ir_url = company["ir"]
-    logger.info(f"Scraping {name}: {ir_url}")
+    logger.info("Scraping %s: %s", name, ir_url)
     company_slug = name.lower().replace(" ", "_")
     company_dir = os.path.join(DATA_DIR, company_slug)
     ensure_dir(company_dir)
-    logger.debug(f"Company directory: {company_dir}")
+    logger.debug("Company directory: %s", company_dir)
     # store metadata with ticker so UI can show market stats
     meta_path = os.path.join(company_dir, "metadata.json")
     meta = {"name": name, "ticker": company.get("ticker")}
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta, f)
+    with open(meta_path, "wb") as f:
+        f.write(_dumps(meta))
     history = load_history(company_dir)
+    save_view(company_dir, meta, history)
 
     html = None
     try:
-        logger.debug(f"Requesting IR page {ir_url}")
-        req = urllib.request.Request(ir_url, headers=HEADERS)
-        with urllib.request.urlopen(req, timeout=TIMEOUT) as resp:
-            html = resp.read().decode("utf-8", errors="ignore")
-        logger.debug(f"Downloaded {len(html)} bytes from {ir_url}")
+        logger.debug("Requesting IR page %s", ir_url)
+        html = await asyncio.to_thread(fetch_page, ir_url)
+        logger.debug("Downloaded %s bytes from %s", len(html), ir_url)
     except Exception as e:
-        logger.error(f"Failed to download {ir_url}: {e}")
+        logger.error("Failed to download %s: %s", ir_url, e)
 
     links = []
+    digest = None
     if html:
-        parser = LinkParser()
-        parser.feed(html)
-        logger.debug(f"Found {len(parser.links)} links on IR page")
-        links = parser.links
+        digest = hashlib.blake2b(html.encode("utf-8", "ignore"), digest_size=16).hexdigest()
+        if history and digest == read_digest(company_dir):
+            logger.info("IR page for %s is unchanged, skipping", name)
+            return
+        links = extract_links(html)
+        logger.debug("Found %s links on IR page", len(links))
+        if not links:
+            # the Playwright fallback sees a different page than this HTML
+            digest = None
 
     if not links and PLAYWRIGHT_AVAILABLE:
         try:
-            links = fetch_links_playwright(ir_url)
+            links = await fetch_links_playwright(ir_url)
         except Exception as e:
-            logger.error(f"Playwright scraping failed for {ir_url}: {e}")
+            logger.error("Playwright scraping failed for %s: %s", ir_url, e)
             return
     elif not links:
         return
 
-    new_links = []
+    # downloads run concurrently, so two links resolving to the same
+    # file must not both be fetched
+    debug = logger.isEnabledFor(logging.DEBUG)
+    todo = []
+    seen_urls = set()
+    seen_paths = set()
     for link in links:
-        abs_url = urljoin(ir_url, link)
+        # most IR pages link straight to a CDN, which needs no urljoin
+        if link.startswith(("https://", "http://")):
+            abs_url = canonical_url(link)
+        else:
+            abs_url = canonical_url(urljoin(ir_url, link))
+        if abs_url in seen_urls:
+            continue
+        seen_urls.add(abs_url)
         if abs_url in history:
-            logger.debug(f"Skipping already downloaded {abs_url}")
+            # known URLs cost no request at all, not even a HEAD
+            if debug:
+                logger.debug("Skipping already downloaded %s", abs_url)
             continue
-        filename = os.path.basename(urlparse(abs_url).path)
+        filename = url_filename(abs_url)
         if not filename:
             continue
         dest_path = os.path.join(company_dir, filename)
-        try:
-            logger.info(f"  downloading {abs_url}")
-            download_file(abs_url, dest_path)
-            history[abs_url] = filename
-            new_links.append(dest_path)
-        except Exception as e:
-            logger.error(f"  failed {abs_url}: {e}")
+        if dest_path in seen_paths:
+            continue
+        seen_paths.add(dest_path)
+        todo.append((abs_url, filename, dest_path))
+
+    # a relocated file keeps its ETag / Last-Modified and size, so index
+    # what is already on disk to recognise it under a new URL
+    known = {}
+    for record in history.values():
+        for key in content_keys(record):
+            known[key] = record
+
+    job = {
+        "dir": company_dir,
+        "meta": meta,
+        "history": history,
+        "known": known,
+        "digest": digest,
+        "pending": len(todo),
+        "new_links": [],
+        "recorded": False,
+        "failed": False,
+    }
+    if not todo:
+        finish_company(job)
+        return
+    for abs_url, filename, dest_path in todo:
+        await queue.put((job, abs_url, filename, dest_path))
 
-    if new_links:
-        save_history(company_dir, history)
-        for path in new_links:
+
+async def fetch_link(job: dict, abs_url: str, filename: str, dest_path: str) -> None:
+    company_dir = job["dir"]
+    known = job["known"]
+    try:
+        validators = await asyncio.to_thread(probe_file, abs_url)
+    except Exception as e:
+        logger.debug("HEAD failed for %s: %s", abs_url, e)
+        validators = {}
+    same = next((known[k] for k in content_keys(validators) if k in known), None)
+    if same is not None and os.path.exists(os.path.join(company_dir, same["file"])):
+        logger.info("  %s is the same file as %s, not downloading", abs_url, same["file"])
+        record = {**validators, "file": same["file"]}
+    else:
+        logger.info("  downloading %s", abs_url)
+        validators = await asyncio.to_thread(download_file, abs_url, dest_path)
+        record = {**validators, "file": filename}
+        job["new_links"].append(dest_path)
+    # journal each file as soon as it lands so a crash loses nothing; all
+    # bookkeeping runs on the event loop, so it needs no lock
+    append_history(company_dir, abs_url, record)
+    job["history"][abs_url] = record
+    for key in content_keys(record):
+        known[key] = record
+
+
+def finish_company(job: dict) -> None:
+    """Persist a company's results once its last queued link is handled."""
+    company_dir = job["dir"]
+    # only remember the page once every link on it is handled, otherwise
+    # failed downloads would never be retried
+    if job["digest"] and not job["failed"]:
+        write_digest(company_dir, job["digest"])
+    if job["recorded"]:
+        save_history(company_dir, job["history"])
+        save_view(company_dir, job["meta"], job["history"])
+        for path in job["new_links"]:
             push_to_chatgpt(path)
 
 
-def scrape_all() -> None:
+async def download_worker(queue: asyncio.Queue) -> None:
+    """Drain queued links until a None sentinel arrives."""
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        job, abs_url, filename, dest_path = item
+        try:
+            await fetch_link(job, abs_url, filename, dest_path)
+            job["recorded"] = True
+        except Exception as e:
+            logger.error("  failed %s: %s", abs_url, e)
+            job["failed"] = True
+        job["pending"] -= 1
+        if job["pending"] == 0:
+            try:
+                finish_company(job)
+            except Exception as e:
+                logger.error("Failed to save results in %s: %s", job["dir"], e)
+
+
+async def scrape_all() -> None:
     logger.info("Starting scrape of all companies")
     ensure_dir(DATA_DIR)
-    for company in COMPANIES:
-        scrape_company(company)
+    # asyncio.to_thread otherwise runs on min(32, cpu_count + 4) threads,
+    # which throttles the downloads on small machines
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=HTTP_WORKERS, thread_name_prefix="scraper")
+    )
+    # IR pages are fetched and parsed by up to COMPANY_CONCURRENCY producers
+    # while DOWNLOAD_WORKERS consumers download the links they find, so
+    # parsing one company overlaps with downloading another's files
+    queue: asyncio.Queue = asyncio.Queue(maxsize=LINK_QUEUE_SIZE)
+    workers = [asyncio.create_task(download_worker(queue)) for _ in range(DOWNLOAD_WORKERS)]
+    slots = asyncio.Semaphore(COMPANY_CONCURRENCY)
+
+    async def produce(company: dict) -> None:
+        async with slots:
+            await scrape_company(company, queue)
+
+    try:
+        await asyncio.gather(*(produce(company) for company in COMPANIES))
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await close_browser()
 
 
 def schedule_daily() -> None:
     while True:
-        scrape_all()
+        asyncio.run(scrape_all())
         logger.info("Sleeping for 24h...")
         time.sleep(60 * 60 * 24)
 
 
 if __name__ == "__main__":
     logger.info("Running scraper once")
-    scrape_all()
+    asyncio.run(scrape_all())